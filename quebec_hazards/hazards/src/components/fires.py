@@ -1,24 +1,31 @@
+import functools
 import geopandas as gpd
-import io
+import hashlib
+import json
+import numpy as np
 import pandas as pd
 import requests
 import tempfile
 import zipfile
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
+from itertools import repeat
 from loguru import logger
+from multiprocessing import get_context
 from pathlib import Path
 from pydantic import (
     BaseModel,
     Field,
     ConfigDict,
+    computed_field,
     field_validator,
-    model_validator,
+    TypeAdapter,
     ValidationError,
 )
 from shapely import Point
 from typing import List, Optional
-from typing import List, Union, Optional, Tuple, Type
+from typing import Dict, List, Union, Optional, Tuple, Type
 
 
 class FirePoint(BaseModel):
@@ -99,7 +106,6 @@ class FirePoint(BaseModel):
 
     latitude: float = Field(..., alias="LATITUDE")
     longitude: float = Field(..., alias="LONGITUDE")
-    location: Optional[Tuple[float, float]] = Field(None, description="(lat, lon)")
 
     @field_validator("prescribed", mode="before")
     @classmethod
@@ -117,7 +123,12 @@ class FirePoint(BaseModel):
     )
     @classmethod
     def parse_dates(cls, v):
-        if isinstance(v, (date, datetime)):
+        # Dates are usually parsed in bulk by the loader before validation
+        if v is pd.NaT:
+            return None
+        if isinstance(v, datetime):
+            return v.date()
+        if isinstance(v, date):
             return v
         if not v or str(v).strip() in {"", "0000/00/00", "0000-00-00"}:
             return None
@@ -128,13 +139,10 @@ class FirePoint(BaseModel):
                 continue
         return None
 
-    @model_validator(mode="after")
-    def set_location(self):
-        if self.location is None:
-            if self.latitude is None or self.longitude is None:
-                raise ValueError("Missing latitude or longitude to build location")
-            self.location = (self.latitude, self.longitude)
-        return self
+    @computed_field(description="(lat, lon)")
+    @property
+    def location(self) -> Tuple[float, float]:
+        return (self.latitude, self.longitude)
 
     def __str__(self):
         return f"🔥 {self.fire_id or 'N/A'} on {self.ignition_date or f'{self.year}-{self.month:02d}'} — {self.size_ha or 0:.1f} ha"
@@ -145,6 +153,58 @@ class FirePoint(BaseModel):
     )
 
 
+@functools.cache
+def _adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+@functools.cache
+def _alias_map(model: Type[BaseModel]) -> Dict[str, str]:
+    return {
+        field.alias: name
+        for name, field in model.model_fields.items()
+        if field.alias != name
+    }
+
+
+@functools.cache
+def _schema_hash(model: Type[BaseModel]) -> str:
+    """
+    Short digest of the model's JSON schema, which changes along with the
+    fields of the model.
+    """
+    schema = json.dumps(model.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode()).hexdigest()[:12]
+
+
+def _validate_chunk(
+    model: Type[BaseModel], records: List[dict]
+) -> Tuple[List[dict], Dict[int, str]]:
+    """
+    Validate a batch of records against a model.
+
+    Defined at module level so that it can run in worker processes. Returns
+    the model dumps of the valid records, along with the error message of
+    the invalid ones keyed by their index in the batch.
+    """
+    adapter = _adapter(model)
+    failures = {}
+
+    # The batch crosses into pydantic-core once rather than once per record
+    try:
+        models = adapter.validate_python(records)
+    except ValidationError as e:
+        # Errors are located by the index of the record in the batch.
+        # Validate the others again without the failing ones.
+        for error in e.errors():
+            failures.setdefault(error["loc"][0], error["msg"])
+        models = adapter.validate_python(
+            [record for i, record in enumerate(records) if i not in failures]
+        )
+
+    return adapter.dump_python(models), failures
+
+
 class FirePointDataLoader:
     """
     Basic data fire loader based on the Canadian National Fire Database (CNFDB)
@@ -166,72 +226,301 @@ class FirePointDataLoader:
 
     DATA_URL = "https://cwfis.cfs.nrcan.gc.ca/downloads/nfdb/fire_pnt/current_version/NFDB_point.zip"
 
+    SHAPEFILE_EXTENSIONS = (".shp", ".shx", ".dbf", ".prj", ".cpg")
+    CHUNK_SIZE = 1 << 20  # bytes
+    VALIDATION_CHUNK_SIZE = 10_000  # rows
+    MAX_REPORTED = 20  # validation errors logged individually
+
+    DATE_COLUMNS = ("REP_DATE", "ATTK_DATE", "OUT_DATE", "ACQ_DATE")
+    NUMERIC_COLUMNS = ("YEAR", "MONTH", "DAY", "SIZE_HA", "LATITUDE", "LONGITUDE")
+    INTEGER_COLUMNS = ("YEAR", "MONTH", "DAY")
+
+    CACHE_DIR = Path.home() / ".cache" / "hazards"
+    CACHE_VERSION = 2  # to bump whenever validate() changes its output
+    # Response header of each cache validator, and the request header sending it back
+    CONDITIONAL_HEADERS = {
+        "ETag": "If-None-Match",
+        "Last-Modified": "If-Modified-Since",
+    }
+
     def __init__(
         self,
+        cache_dir: Optional[Path] = CACHE_DIR,
     ):
         self.gdf: Optional[gpd.GeoDataFrame] = None
         self.model: Type[BaseModel] = FirePoint
+        self.cache_dir: Optional[Path] = Path(cache_dir) if cache_dir else None
+        # Reuses connections across requests
+        self.session = requests.Session()
 
-    def _download_and_extract(self) -> gpd.GeoDataFrame:
+    def _download_and_extract(
+        self, validators: Optional[dict] = None
+    ) -> Tuple[Optional[gpd.GeoDataFrame], dict]:
         """
-        Download the ZIP archive into memory, finds the .shp
-        file and reads it into a geopandas dataframe.
+        Stream the ZIP archive to a temporary directory, extracts the .shp
+        file and its companions and reads them into a geopandas dataframe.
+
+        Given the ETag/Last-Modified validators of a previous download, the
+        request is conditional and no dataframe is returned if the archive is
+        unchanged. Also returns the validators of the archive.
         """
-        logger.info("📥 Downloading wildfire data from Canadian NFDB...")
+        validators = validators or {}
+        headers = {
+            header: validators[key]
+            for key, header in self.CONDITIONAL_HEADERS.items()
+            if validators.get(key)
+        }
 
-        r = requests.get(self.DATA_URL)
-        r.raise_for_status()
-        zip_bytes = io.BytesIO(r.content)
+        logger.info("📥 Downloading wildfire data from Canadian NFDB...")
 
         with tempfile.TemporaryDirectory() as tmpdir:
-            z = zipfile.ZipFile(zip_bytes)
-            z.extractall(tmpdir)
-            shp_path = next(Path(tmpdir).rglob("*.shp"))
+            zip_path = Path(tmpdir) / "NFDB_point.zip"
+
+            # Write the archive to disk chunk by chunk rather than holding
+            # the whole response body in memory.
+            with self.session.get(self.DATA_URL, headers=headers, stream=True) as r:
+                if r.status_code == 304:
+                    logger.info("✅ Wildfire data is unchanged since last download.")
+                    return None, validators
+                r.raise_for_status()
+                validators = {
+                    key: r.headers[key]
+                    for key in self.CONDITIONAL_HEADERS
+                    if key in r.headers
+                }
+                with open(zip_path, "wb") as f:
+                    for chunk in r.iter_content(chunk_size=self.CHUNK_SIZE):
+                        f.write(chunk)
+
+            # Only extract the files making up the shapefile itself
+            with zipfile.ZipFile(zip_path) as z:
+                namelist = z.namelist()
+                names = set(namelist)
+                shp_name = next(n for n in namelist if n.endswith(".shp"))
+                for ext in self.SHAPEFILE_EXTENSIONS:
+                    name = shp_name[: -len(".shp")] + ext
+                    if name in names:
+                        z.extract(name, tmpdir)
+            shp_path = Path(tmpdir) / shp_name
             logger.info(f"✅ Extracted shapefile to: {shp_path}")
 
             try:
-                gdf = gpd.read_file(shp_path)
+                # pyogrio streams the records through GDAL's Arrow interface,
+                # which is much faster than the row-by-row Fiona reader.
+                gdf = gpd.read_file(shp_path, engine="pyogrio", use_arrow=True)
             except Exception as e:
                 logger.error(f"Shapefile reading error: {e}")
 
-            return gdf
+            return gdf, validators
 
     @property
     def alias_map(self) -> dict:
-        return {
-            field.alias: name
-            for name, field in self.model.model_fields.items()
-            if field.alias != name
-        }
+        return _alias_map(self.model)
+
+    @property
+    def schema_hash(self) -> str:
+        return _schema_hash(self.model)
+
+    def _parse_date_columns(self, attributes: pd.DataFrame) -> pd.DataFrame:
+        """
+        Parse the date columns in bulk, ahead of any model validation.
+
+        Missing or unparseable dates become None, as they would through
+        FirePoint.parse_dates, which then has nothing left to parse.
+        """
+        parsed = {}
+        for column in self.DATE_COLUMNS:
+            if column not in attributes:
+                continue
+            values = attributes[column]
+            if not pd.api.types.is_datetime64_any_dtype(values):
+                # Both accepted formats reduce to ISO once separators are unified,
+                # which keeps pandas on its C parser. Sentinels such as
+                # "0000/00/00" or "" are coerced to NaT, i.e. missing.
+                values = pd.to_datetime(
+                    values.astype("string").str.replace("/", "-", regex=False),
+                    format="%Y-%m-%d",
+                    errors="coerce",
+                    cache=True,
+                )
+            parsed[column] = values.dt.date.astype(object).where(values.notna(), None)
+
+        return attributes.assign(**parsed)
+
+    def _coerce(self, attributes: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        Column-wise equivalent of the FirePoint field validators, for
+        attributes whose dates were already parsed.
+
+        Returns the coerced attributes along with a boolean mask of the rows
+        which are known to conform to the data model. Rows outside the mask
+        still need to go through the pydantic model.
+        """
+        # Missing values are normalised to None so that Optional fields hold
+        # None rather than NaN, as they would in a model dump.
+        coerced = attributes.astype(object).where(attributes.notna(), None)
+        valid = np.ones(len(coerced), dtype=bool)
+
+        for column in self.NUMERIC_COLUMNS:
+            if column not in coerced:
+                continue
+            values = pd.to_numeric(coerced[column], errors="coerce")
+            if column in self.INTEGER_COLUMNS:
+                values = values.where(np.floor(values) == values).astype("Int64")
+            # Values which were present but could not be coerced are left for
+            # the pydantic model to report on.
+            valid &= ~(coerced[column].notna() & values.isna()).to_numpy()
+            coerced[column] = values
+
+        if "PRESCRIBED" in coerced and not pd.api.types.is_bool_dtype(
+            attributes["PRESCRIBED"]
+        ):
+            is_prescribed = coerced["PRESCRIBED"].astype("string").str.strip().eq("PB")
+            coerced["PRESCRIBED"] = pd.Series(
+                np.where(is_prescribed.fillna(False), True, None),
+                index=coerced.index,
+                dtype=object,
+            )
+
+        for name, field in self.model.model_fields.items():
+            column = field.alias or name
+            if field.annotation in (str, Optional[str]) and column in coerced:
+                # Values of any other type are left for the pydantic model to
+                # convert or report on.
+                is_str = coerced[column].map(type).isin([str, type(None)])
+                valid &= is_str.to_numpy()
+            if field.is_required():
+                if column not in coerced:
+                    valid[:] = False
+                    break
+                valid &= coerced[column].notna().to_numpy()
+
+        return coerced, valid
+
+    def _to_model_fields(self, coerced: pd.DataFrame) -> pd.DataFrame:
+        """
+        Shape coerced attributes like the model dump of a FirePoint.
+        """
+        df = coerced.rename(columns=self.alias_map).reindex(
+            columns=list(self.model.model_fields), fill_value=None
+        )
+        # Mirrors the FirePoint.location computed field
+        df["location"] = list(zip(df["latitude"], df["longitude"]))
+
+        # Match the dtypes pandas infers from model dumps, where integers with
+        # missing values end up as floats.
+        for column in df.columns[df.dtypes == "Int64"]:
+            df[column] = df[column].astype("float64" if df[column].hasnans else "int64")
+        return df.infer_objects()
+
+    def _validate_rows(
+        self,
+        attributes: pd.DataFrame,
+        positions: np.ndarray,
+        n_jobs: int = 1,
+    ) -> pd.DataFrame:
+        """
+        Validate rows against the pydantic model, in batches.
+
+        Batches are spread over ``n_jobs`` worker processes when asked for
+        more than one. Workers re-import the stack and every record is
+        pickled across, so this only pays off on large amounts of rows.
+
+        Returns the model dumps of the valid rows, indexed by their position
+        in the original dataframe.
+        """
+        validated_rows, validated_positions = [], []
+        n_failed: int = 0
+        # Missing values are normalised to None so that Optional fields
+        # validate as such instead of as NaN.
+        attributes = attributes.astype(object).where(attributes.notna(), None)
+        records = attributes.to_dict(orient="records")
+
+        starts = range(0, len(records), self.VALIDATION_CHUNK_SIZE)
+        chunks = [records[i : i + self.VALIDATION_CHUNK_SIZE] for i in starts]
+        n_jobs = min(n_jobs, len(chunks))
+
+        if n_jobs > 1:
+            with ProcessPoolExecutor(
+                max_workers=n_jobs, mp_context=get_context("spawn")
+            ) as pool:
+                results = list(
+                    pool.map(_validate_chunk, repeat(self.model, len(chunks)), chunks)
+                )
+        else:
+            results = [_validate_chunk(self.model, chunk) for chunk in chunks]
+
+        for start, chunk, (rows, failures) in zip(starts, chunks, results):
+            chunk_positions = positions[start : start + len(chunk)]
+            for i, msg in failures.items():
+                if n_failed < self.MAX_REPORTED:
+                    logger.warning(
+                        f"⚠️ Validation error (row {chunk_positions[i]}):\n{chunk[i]}\n: {msg}"
+                    )
+                n_failed += 1
+            validated_rows.extend(rows)
+            validated_positions.extend(np.delete(chunk_positions, list(failures)))
+
+        if n_failed > self.MAX_REPORTED:
+            logger.warning(
+                f"⚠️ {n_failed - self.MAX_REPORTED} more validation errors were not reported."
+            )
+
+        return pd.DataFrame(
+            validated_rows,
+            index=validated_positions,
+            columns=list(self.model.model_fields)
+            + list(self.model.model_computed_fields),
+        )
 
     def validate(
-        self, gdf: gpd.GeoDataFrame, tolerance: float = 0.05, tag: str = "🔥"
+        self,
+        gdf: gpd.GeoDataFrame,
+        tolerance: float = 0.05,
+        tag: str = "🔥",
+        strict: bool = False,
+        n_jobs: int = 1,
     ) -> Tuple[gpd.GeoDataFrame, float]:
+        """
+        Validate the NFDB attributes against the data model.
+
+        Columns are coerced and checked column-wise, and only the rows failing
+        those checks are run through the pydantic model, which either recovers
+        them or reports why they are skipped. With ``strict=True`` every row
+        is validated by the pydantic model instead. Model validation runs
+        in-process unless ``n_jobs`` asks for several worker processes and
+        rows span several batches.
+        """
         # vocation to become a general method in a parent class
-        validated_rows, validated_geoms = [], []
-        n_skipped: int = 0
-
-        for idx, row in gdf.iterrows():
-            try:
-                model_instance = self.model.model_validate(row.to_dict())
-                validated_rows.append(model_instance.model_dump())
-                validated_geoms.append(row["geometry"])
-            except ValidationError as e:
-                n_skipped += 1
-                print(
-                    f"⚠️ Validation error (row {idx}):\n{row.to_dict()}\n: {e.errors()[0]['msg']}"
-                )
+        attributes = self._parse_date_columns(gdf.drop(columns=gdf.geometry.name))
 
-        if len(validated_rows) > 0:
-            logger.success(
-                f"{tag}\t✅ {len(validated_rows)} records passed validation."
+        if strict:
+            validated = self._validate_rows(
+                attributes, np.arange(len(attributes)), n_jobs=n_jobs
             )
+        else:
+            coerced, valid = self._coerce(attributes)
+            failed = np.flatnonzero(~valid)
+            vectorized = self._to_model_fields(coerced[valid])
+            vectorized.index = np.flatnonzero(valid)
+            recovered = self._validate_rows(
+                attributes.iloc[failed], failed, n_jobs=n_jobs
+            )
+            validated = pd.concat(
+                [df for df in (vectorized, recovered) if len(df) > 0] or [vectorized]
+            ).sort_index()
+
+        n_validated: int = len(validated)
+        n_skipped: int = len(gdf) - n_validated
+
+        if n_validated > 0:
+            logger.success(f"{tag}\t✅ {n_validated} records passed validation.")
         if n_skipped > 0:
             logger.warning(
                 f"{tag}\t⚠ {n_skipped} samples did not comform to expectations and were skipped."
             )
 
-        pass_rate: float = len(validated_rows) / len(gdf)
+        pass_rate: float = n_validated / len(gdf)
 
         if pass_rate > (1 - tolerance):
             logger.success(f"{tag}\t🌏 Healthy data state ({pass_rate:.0%}) success.")
@@ -241,26 +530,103 @@ class FirePointDataLoader:
             )
 
         validated_gdf = gpd.GeoDataFrame(
-            validated_rows, geometry=validated_geoms, crs=gdf.crs
+            validated.reset_index(drop=True),
+            geometry=gdf.geometry.values[validated.index.to_numpy(dtype=int)],
+            crs=gdf.crs,
         )
 
         return validated_gdf, pass_rate
 
-    def load(self, force_reload: bool = False, validate: bool = True):
+    def cache_path(self, validate: bool = True) -> Optional[Path]:
+        """
+        Location of the GeoParquet copy of the parsed data, if caching is enabled.
+
+        Validated data is stored under the version of the loader and the hash
+        of the model, so that stale data is not read back once either changes.
+        """
+        if self.cache_dir is None:
+            return None
+        if validate:
+            name = f"nfdb_point_v{self.CACHE_VERSION}_{self.schema_hash}"
+        else:
+            name = "nfdb_point_raw"
+        return self.cache_dir / f"{name}.parquet"
+
+    @staticmethod
+    def _read_validators(cache_path: Path) -> dict:
+        """
+        ETag/Last-Modified of the archive the cached data was parsed from.
+        """
+        validators_path = cache_path.with_suffix(".json")
+        if not validators_path.exists():
+            return {}
+        return json.loads(validators_path.read_text())
+
+    def load(
+        self,
+        force_reload: bool = False,
+        validate: bool = True,
+        strict: bool = False,
+        n_jobs: int = 1,
+    ):
+        """
+        Load the NFDB fire points, from the cache when it is up to date.
+
+        ``strict`` and ``n_jobs`` are handed over to validate(), and so only
+        matter when the data is parsed afresh.
+        """
         if self.gdf is not None and not force_reload:
             return self.gdf
 
-        gdf = self._download_and_extract()
+        cache_path = self.cache_path(validate=validate)
+        cached = cache_path is not None and cache_path.exists() and not force_reload
+        validators = self._read_validators(cache_path) if cached else {}
 
-        # Basic cleaning
-        gdf = gdf.to_crs("EPSG:4326")
+        gdf = None
+        if not cached or validators:
+            # Revalidate the cached data against the server, which answers
+            # with an empty 304 response if the archive has not changed.
+            try:
+                gdf, validators = self._download_and_extract(validators)
+            except requests.RequestException as e:
+                if not cached:
+                    raise
+                logger.warning(f"Could not revalidate cached wildfire data: {e}")
+        elif cached:
+            logger.warning(
+                "Cached wildfire data has no ETag/Last-Modified to revalidate "
+                "against, reload with force_reload=True to refresh it."
+            )
+
+        if gdf is None:
+            logger.info(f"📦 Reading cached wildfire data from: {cache_path}")
+            gdf = gpd.read_parquet(cache_path)
+            if "location" in gdf:
+                # Parquet has no tuple type and reads these back as arrays
+                gdf["location"] = list(zip(gdf["latitude"], gdf["longitude"]))
+            self.gdf = gdf
+            return self.gdf
+
+        # Basic cleaning, sparing a transform of every point when the data
+        # already comes in WGS84
+        if gdf.crs is None or gdf.crs.to_epsg() != 4326:
+            gdf = gdf.to_crs("EPSG:4326")
 
         if validate:
-            gdf, _ = self.validate(gdf)
+            gdf, _ = self.validate(gdf, strict=strict, n_jobs=n_jobs)
 
         gdf = gdf.rename(columns=str.lower)
 
+        if cache_path is not None:
+            # Columnar reads of GeoParquet are much cheaper than parsing the
+            # shapefile, and spare the validation on the next load.
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            gdf.to_parquet(cache_path, compression="zstd")
+            cache_path.with_suffix(".json").write_text(json.dumps(validators))
+            logger.info(f"📦 Cached wildfire data to: {cache_path}")
+
         self.gdf = gdf
+        return self.gdf
 
     @property
     def data(
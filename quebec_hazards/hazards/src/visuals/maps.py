@@ -1,5 +1,6 @@
 import folium
 import geopandas as gpd
+import math
 import pandas as pd
 import numpy as np
 import pydeck as pdk
@@ -7,6 +8,7 @@ import streamlit as st
 
 from folium.plugins import MarkerCluster
 from loguru import logger
+from numba import njit
 from plotly.colors import sequential
 from pydeck import ViewState
 
@@ -33,27 +35,56 @@ def map_ordinal_to_plotly_color(values, palette=None, alpha=140):
         alpha (int): Alpha channel (0–255)
 
     Returns:
-        List of RGBA colors as [r, g, b, alpha]
+        np.ndarray of shape (N, 4) and dtype uint8, one [r, g, b, alpha] row per value
     """
     if palette is None:
         palette = sequential.Viridis
 
-    values = pd.Series(values)
-    unique_vals = sorted(values.dropna().unique())
-    n_colors = len(palette)
+    palette_rgba = np.array(
+        [
+            [int(hex_color.lstrip("#")[i : i + 2], 16) for i in (0, 2, 4)] + [alpha]
+            for hex_color in palette
+        ],
+        dtype=np.uint8,
+    )
 
-    # Build mapping from unique value to color (loop palette if needed)
-    val_to_color = {val: palette[i % n_colors] for i, val in enumerate(unique_vals)}
+    # Integer codes follow the sorted unique values; missing values get -1
+    codes, _ = pd.factorize(pd.Series(values), sort=True)
 
-    def hex_to_rgba(hex_color, alpha):
-        hex_color = hex_color.lstrip("#")
-        r, g, b = [int(hex_color[i : i + 2], 16) for i in (0, 2, 4)]
-        return [r, g, b, alpha]
+    # Loop the palette if there are more unique values than colors
+    colors = palette_rgba[codes % len(palette_rgba)]
+    colors[codes == -1] = [150, 150, 150, alpha]
 
-    return [
-        hex_to_rgba(val_to_color[v], alpha) if pd.notnull(v) else [150, 150, 150, alpha]
-        for v in values
-    ]
+    return colors
+
+
+@njit(cache=True)
+def _radii(
+    size_ha: np.ndarray, lo: float, hi: float, rmin: float, rmax: float
+) -> np.ndarray:
+    """
+    Square-root scale clipped sizes, then rescale them to [rmin, rmax].
+
+    Fused into two passes over the data instead of one temporary array per
+    operation. Missing sizes are left as NaN.
+    """
+    out = np.empty_like(size_ha)
+    mn, mx = np.inf, -np.inf
+
+    for i in range(size_ha.size):
+        if math.isnan(size_ha[i]):
+            out[i] = np.nan
+            continue
+        v = math.sqrt(min(max(size_ha[i], lo), hi))
+        out[i] = v
+        mn = min(mn, v)
+        mx = max(mx, v)
+
+    scale = (rmax - rmin) / (mx - mn) if mx > mn else 0.0
+    for i in range(out.size):
+        out[i] = (out[i] - mn) * scale + rmin
+
+    return out
 
 
 def make_folium_fire_map(gdf: gpd.GeoDataFrame, zoom_start: float = 5) -> folium.Map:
@@ -62,15 +93,28 @@ def make_folium_fire_map(gdf: gpd.GeoDataFrame, zoom_start: float = 5) -> folium
 
     cluster = MarkerCluster().add_to(m)
 
-    for _, row in gdf.iterrows():
-        popup = (
-            f"🔥 {row.get('fire_name', 'Unknown')}<br>"
-            f"Size: {row.get('size_ha', 0):,.1f} ha<br>"
-            f"Cause: {row.get('cause_primary', 'N/A')}<br>"
-            f"Date: {row.get('report_date', 'Unknown')}"
-        )
+    def column(name: str, default) -> pd.Series:
+        if name not in gdf:
+            return pd.Series(default, index=gdf.index)
+        return gdf[name].fillna(default)
+
+    # Build popups column-wise, and only loop to create the markers
+    popups = (
+        "🔥 "
+        + column("fire_name", "Unknown").astype(str)
+        + "<br>Size: "
+        + column("size_ha", 0).map("{:,.1f}".format)
+        + " ha<br>Cause: "
+        + column("cause_primary", "N/A").astype(str)
+        + "<br>Date: "
+        + column("report_date", "Unknown").astype(str)
+    ).tolist()
+    ys = gdf.geometry.y.to_numpy()
+    xs = gdf.geometry.x.to_numpy()
+
+    for y, x, popup in zip(ys, xs, popups):
         folium.CircleMarker(
-            location=(row.geometry.y, row.geometry.x),
+            location=(y, x),
             radius=4,
             fill=True,
             color="red",
@@ -94,26 +138,40 @@ def make_pydeck_map(
 
     initial_view = default_view_states(setting=view_state_ref)
 
-    df = gdf.copy()
-    df["size_ha_fmt"] = df["size_ha"].map("{:,.0f}".format)
+    # Share the underlying arrays rather than copying the whole frame, since
+    # the layer only adds columns. Geometries are not JSON serializable, and
+    # the layer reads coordinates from the longitude/latitude columns anyway.
+    columns = [
+        c
+        for c in gdf.columns
+        if not (isinstance(gdf, gpd.GeoDataFrame) and c == gdf.geometry.name)
+    ]
+    df = pd.DataFrame({c: gdf[c].to_numpy() for c in columns}, copy=False)
+
+    # Formatted row by row, which keeps the thousands separator in the tooltip
+    df["size_ha_fmt"] = gdf["size_ha"].fillna(0).map("{:,.0f}".format).to_numpy()
 
     if color_by_year:
-        df["fill_color"] = map_ordinal_to_plotly_color(
+        # One contiguous uint8 column per channel rather than an object
+        # column holding a Python list per row
+        colors = map_ordinal_to_plotly_color(
             df["year"], palette=sequential.Plasma, alpha=140
         )
+        for i, channel in enumerate(("fill_r", "fill_g", "fill_b", "fill_a")):
+            df[channel] = colors[:, i]
+        get_fill_color = "[fill_r, fill_g, fill_b, fill_a]"
     else:
-        df["fill_color"] = [[255, 0, 0, alpha]] * len(gdf)
+        # A constant accessor needs no per-row data at all
+        get_fill_color = [255, 0, 0, alpha]
 
     if size_by_area:
-        # Square root scale, then normalize
-        scaled = np.sqrt(df["size_ha"].clip(0.1, 10000))  # cap at 10,000 ha
-
-        # Normalize to [0, 1]
-        scaled = (scaled - scaled.min()) / (scaled.max() - scaled.min())
-
-        # Scale to pixel range
-        df["radius"] = (
-            scaled * (max_display_radius - min_display_radius) + min_display_radius
+        # Square root scale capped at 10,000 ha, normalized to the pixel range
+        df["radius"] = _radii(
+            df["size_ha"].to_numpy(dtype=np.float64, na_value=np.nan),
+            0.1,
+            10000.0,
+            float(min_display_radius),
+            float(max_display_radius),
         )
     else:
         df["radius"] = 2000
@@ -126,7 +184,7 @@ def make_pydeck_map(
                 data=df,
                 get_position="[longitude, latitude]",
                 get_radius="radius",
-                get_fill_color="fill_color",
+                get_fill_color=get_fill_color,
                 pickable=True,
             ),
         ],
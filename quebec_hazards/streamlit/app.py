@@ -1,22 +1,70 @@
-import geopandas as gpd
 import importlib
+import os
+import pandas as pd
 import streamlit as st
 
 from datetime import date
 from hazards.src.components import fires
 from hazards.src.visuals import maps
 
-importlib.reload(maps)
+# Reloading on every rerun redefines the module's functions, so only do it
+# when iterating on the library.
+if os.getenv("DEV_RELOAD"):
+    importlib.reload(maps)
 
+TOOLTIP = {
+    "html": "<b>{fire_id}</b> {fire_name}<br/>Size: {size_ha_fmt} ha<br/>Year: {year}<br/>Long.: {longitude} Lat.: {latitude}",
+    "style": {"backgroundColor": "steelblue", "color": "white"},
+}
 
-@st.cache_data(show_spinner=True)
-def load_fires() -> gpd.GeoDataFrame:
+
+# Held as a resource so that every rerun gets the same frame, rather than an
+# unpickled copy of it, which is what build_deck keys its cache on.
+@st.cache_resource(show_spinner=True)
+def load_fires() -> pd.DataFrame:
     loader = fires.FirePointDataLoader()
     loader.load()
 
-    data = loader.data.copy()
+    # The map reads the longitude/latitude columns, so geometries are dropped
+    # and a plain DataFrame is cached.
+    data = pd.DataFrame(loader.data.drop(columns="geometry"))
     data["fire_name"] = data["fire_name"].fillna("")
-    return data.drop(columns="geometry")
+
+    # Sorted by report date so that date filters reduce to a binary search
+    return data.sort_values("report_date", na_position="first", ignore_index=True)
+
+
+def filter_since(gdf: pd.DataFrame, selected_date: date) -> pd.DataFrame:
+    """
+    Fires reported on or after the selected date.
+
+    Expects fires sorted by report date with missing dates first, as returned
+    by load_fires.
+    """
+    report_dates = gdf["report_date"]
+    start = report_dates.first_valid_index()
+    if start is None:
+        return gdf.iloc[:0]
+    i = start + report_dates.iloc[start:].searchsorted(selected_date)
+    return gdf.iloc[i:]
+
+
+# Decks hold their data as one dict per fire, so only a few are kept. The
+# frame is keyed on its identity, which changes when load_fires recomputes.
+@st.cache_resource(show_spinner=False, max_entries=4, hash_funcs={pd.DataFrame: id})
+def build_deck(
+    gdf: pd.DataFrame,
+    selected_date: date,
+    color_by_year: bool,
+    size_by_area: bool,
+):
+    filtered = filter_since(gdf, selected_date)
+    return maps.make_pydeck_map(
+        filtered[["longitude", "latitude", "fire_name", "fire_id", "size_ha", "year"]],
+        color_by_year=color_by_year,
+        size_by_area=size_by_area,
+        tooltip=TOOLTIP,
+    )
 
 
 def main():
@@ -49,22 +97,12 @@ def main():
     with cell_1_3:
         size_by_area = st.checkbox("Scale by fire size", value=True)
 
-    filtered = gdf[gdf["report_date"] >= selected_date]
+    filtered = filter_since(gdf, selected_date)
     st.write(
         f"Showing {len(filtered):,} fires reported since {selected_date.strftime("%A %d %B %Y")}"
     )
 
-    tooltip = {
-        "html": "<b>{fire_id}</b> {fire_name}<br/>Size: {size_ha_fmt} ha<br/>Year: {year}<br/>Long.: {longitude} Lat.: {latitude}",
-        "style": {"backgroundColor": "steelblue", "color": "white"},
-    }
-
-    deck = maps.make_pydeck_map(
-        filtered[["longitude", "latitude", "fire_name", "fire_id", "size_ha", "year"]],
-        color_by_year=color_by_year,
-        size_by_area=size_by_area,
-        tooltip=tooltip,
-    )
+    deck = build_deck(gdf, selected_date, color_by_year, size_by_area)
     st.pydeck_chart(deck)
 
 
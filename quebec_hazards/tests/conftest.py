@@ -1,7 +1,9 @@
 import pytest
 import geopandas as gpd
 import pandas as pd
-from shapely import Point
+import zipfile
+from loguru import logger
+from shapely import points
 
 
 @pytest.fixture
@@ -89,8 +91,33 @@ def sample_firepoint_df() -> gpd.GeoDataFrame:
         ]
     )
 
-    df["geometry"] = df.apply(
-        lambda row: Point(row["LONGITUDE"], row["LATITUDE"]), axis=1
-    )
+    df["geometry"] = points(df["LONGITUDE"].to_numpy(), df["LATITUDE"].to_numpy())
     gdf = gpd.GeoDataFrame(df, geometry="geometry", crs="EPSG:4326")
     return gdf
+
+
+@pytest.fixture
+def nfdb_archive(sample_firepoint_df, tmp_path) -> bytes:
+    """
+    Zipped shapefile of the sample fires, laid out like the NFDB archive.
+    """
+    shp_dir = tmp_path / "shapefile"
+    shp_dir.mkdir()
+    sample_firepoint_df.to_file(shp_dir / "NFDB_point.shp", engine="pyogrio")
+
+    zip_path = tmp_path / "NFDB_point.zip"
+    with zipfile.ZipFile(zip_path, "w") as z:
+        for path in shp_dir.iterdir():
+            z.write(path, path.name)
+    return zip_path.read_bytes()
+
+
+@pytest.fixture
+def log_warnings() -> list:
+    """
+    Messages logged at warning level or above while the test runs.
+    """
+    messages = []
+    sink = logger.add(messages.append, level="WARNING")
+    yield messages
+    logger.remove(sink)
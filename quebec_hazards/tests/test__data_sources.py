@@ -1,7 +1,14 @@
 import pytest
 import geopandas as gpd
+import json
+import pandas as pd
+import requests
 
-from hazards.src.components.fires import FirePointDataLoader
+from datetime import date
+from pydantic import Field
+from typing import Optional
+
+from hazards.src.components.fires import FirePoint, FirePointDataLoader
 
 
 def test__firedataloader():
@@ -18,8 +25,210 @@ def test__firedataloader_validation(sample_firepoint_df):
     assert pass_rate == 1
 
 
-def test__firedataloader__loading_with_no_validation():
+def test__firedataloader_validation__matches_strict(sample_firepoint_df):
+    fdl = FirePointDataLoader()
+    validated_df, _ = fdl.validate(gdf=sample_firepoint_df)
+    strict_df, _ = fdl.validate(gdf=sample_firepoint_df, strict=True)
+
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(validated_df.drop(columns="geometry")),
+        pd.DataFrame(strict_df.drop(columns="geometry")),
+    )
+
+
+def test__firedataloader_validation__rejects_non_string_ids(sample_firepoint_df):
+    sample_firepoint_df["FIRE_ID"] = [1, 2, 3]
+
+    fdl = FirePointDataLoader()
+    validated_df, pass_rate = fdl.validate(gdf=sample_firepoint_df)
+    strict_df, strict_pass_rate = fdl.validate(gdf=sample_firepoint_df, strict=True)
+
+    assert len(validated_df) == len(strict_df) == 0
+    assert pass_rate == strict_pass_rate == 0
+
+
+def test__firedataloader_validation__skips_invalid_rows(sample_firepoint_df):
+    sample_firepoint_df.loc[1, "LATITUDE"] = None
+
+    fdl = FirePointDataLoader()
+    validated_df, pass_rate = fdl.validate(gdf=sample_firepoint_df)
+
+    assert validated_df["fire_id"].tolist() == ["QC2023_001", "QC2023_003"]
+    assert pass_rate == 2 / 3
+
+
+def test__firedataloader_validation__parallel(sample_firepoint_df):
+    sample_firepoint_df.loc[1, "LATITUDE"] = None
+
     fdl = FirePointDataLoader()
+    fdl.VALIDATION_CHUNK_SIZE = 2
+    validated_df, pass_rate = fdl.validate(
+        gdf=sample_firepoint_df, strict=True, n_jobs=2
+    )
+
+    assert validated_df["fire_id"].tolist() == ["QC2023_001", "QC2023_003"]
+    assert validated_df.geometry.y.tolist() == [48.25, 49.0]
+    assert pass_rate == 2 / 3
+
+
+@pytest.mark.parametrize("strict", [False, True])
+def test__firedataloader_validation__datetime_columns(sample_firepoint_df, strict):
+    sample_firepoint_df["REP_DATE"] = pd.to_datetime(
+        sample_firepoint_df["REP_DATE"], format="%Y/%m/%d", errors="coerce"
+    )
+
+    fdl = FirePointDataLoader()
+    validated_df, _ = fdl.validate(gdf=sample_firepoint_df, strict=strict)
+
+    assert validated_df["report_date"].tolist() == [date(2023, 6, 12), None, None]
+
+
+def test__firedataloader__loading_from_cache(sample_firepoint_df, tmp_path):
+    fdl = FirePointDataLoader(cache_dir=tmp_path)
+    validated_df, _ = fdl.validate(gdf=sample_firepoint_df)
+    validated_df.to_parquet(fdl.cache_path(validate=True))
+
+    fdl.load(validate=True)
+
+    assert isinstance(fdl.data, gpd.GeoDataFrame)
+    assert fdl.data["fire_id"].tolist() == validated_df["fire_id"].tolist()
+    assert fdl.data.crs == validated_df.crs
+    assert fdl.data["location"].tolist() == validated_df["location"].tolist()
+
+
+def test__firedataloader__cache_path_follows_model(tmp_path):
+    class RenamedFirePoint(FirePoint):
+        fire_label: Optional[str] = Field(None, alias="FIRENAME")
+
+    fdl = FirePointDataLoader(cache_dir=tmp_path)
+    other = FirePointDataLoader(cache_dir=tmp_path)
+    # Read before the model is swapped, which must not stick to the loader
+    assert other.cache_path(validate=True) == fdl.cache_path(validate=True)
+    assert "fire_name" in other.alias_map.values()
+    other.model = RenamedFirePoint
+
+    assert fdl.cache_path(validate=True) != other.cache_path(validate=True)
+    assert fdl.cache_path(validate=False) == other.cache_path(validate=False)
+    assert other.alias_map["FIRENAME"] == "fire_label"
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
+
+class FakeSession:
+    """
+    Stands in for the loader's session, answering every request with the
+    same response, or raising it if it is an exception.
+    """
+
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    def get(self, url, headers=None, stream=False):
+        self.requests.append(headers)
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+@pytest.fixture
+def cached_loader(sample_firepoint_df, tmp_path):
+    fdl = FirePointDataLoader(cache_dir=tmp_path)
+    validated_df, _ = fdl.validate(gdf=sample_firepoint_df.iloc[:1])
+    cache_path = fdl.cache_path(validate=True)
+    validated_df.to_parquet(cache_path)
+    cache_path.with_suffix(".json").write_text(json.dumps({"ETag": '"v1"'}))
+    return fdl
+
+
+def test__firedataloader__loading_not_modified(cached_loader):
+    cached_loader.session = FakeSession(FakeResponse(status_code=304))
+    cache_path = cached_loader.cache_path(validate=True)
+    mtime = cache_path.stat().st_mtime_ns
+
+    cached_loader.load(validate=True)
+
+    assert cached_loader.session.requests == [{"If-None-Match": '"v1"'}]
+    assert cached_loader.data["fire_id"].tolist() == ["QC2023_001"]
+    assert cache_path.stat().st_mtime_ns == mtime
+
+
+def test__firedataloader__loading_modified(cached_loader, nfdb_archive):
+    validators = {"ETag": '"v2"', "Last-Modified": "Tue, 14 Oct 2025 08:00:00 GMT"}
+    cached_loader.session = FakeSession(
+        FakeResponse(content=nfdb_archive, headers=validators)
+    )
+    cache_path = cached_loader.cache_path(validate=True)
+
+    gdf = cached_loader.load(validate=True)
+
+    fire_ids = ["QC2023_001", "QC2023_002", "QC2023_003"]
+    assert gdf is cached_loader.data
+    assert cached_loader.data["fire_id"].tolist() == fire_ids
+    assert gpd.read_parquet(cache_path)["fire_id"].tolist() == fire_ids
+    assert json.loads(cache_path.with_suffix(".json").read_text()) == validators
+
+
+def test__firedataloader__loading_in_parallel(nfdb_archive):
+    fdl = FirePointDataLoader(cache_dir=None)
+    fdl.VALIDATION_CHUNK_SIZE = 2
+    fdl.session = FakeSession(FakeResponse(content=nfdb_archive))
+
+    gdf = fdl.load(validate=True, strict=True, n_jobs=2)
+
+    assert gdf["fire_id"].tolist() == ["QC2023_001", "QC2023_002", "QC2023_003"]
+
+
+def test__firedataloader__loading_unreachable_with_cache(cached_loader, log_warnings):
+    cached_loader.session = FakeSession(requests.ConnectionError("unreachable"))
+
+    cached_loader.load(validate=True)
+
+    assert cached_loader.data["fire_id"].tolist() == ["QC2023_001"]
+    assert any("Could not revalidate" in w for w in log_warnings)
+
+
+def test__firedataloader__loading_cache_without_validators(cached_loader, log_warnings):
+    cache_path = cached_loader.cache_path(validate=True)
+    cache_path.with_suffix(".json").write_text("{}")
+    cached_loader.session = FakeSession(requests.ConnectionError("unreachable"))
+
+    cached_loader.load(validate=True)
+
+    assert cached_loader.session.requests == []
+    assert cached_loader.data["fire_id"].tolist() == ["QC2023_001"]
+    assert any("force_reload=True" in w for w in log_warnings)
+
+
+def test__firedataloader__loading_unreachable_without_cache(tmp_path):
+    fdl = FirePointDataLoader(cache_dir=tmp_path)
+    fdl.session = FakeSession(requests.ConnectionError("unreachable"))
+
+    with pytest.raises(requests.ConnectionError):
+        fdl.load(validate=True)
+
+
+def test__firedataloader__loading_with_no_validation():
+    fdl = FirePointDataLoader(cache_dir=None)
     fdl.load(validate=False)
 
     assert isinstance(fdl.data, gpd.GeoDataFrame)
@@ -27,7 +236,7 @@ def test__firedataloader__loading_with_no_validation():
 
 
 def test__firedataloader__loading_with_validation():
-    fdl = FirePointDataLoader()
+    fdl = FirePointDataLoader(cache_dir=None)
     fdl.load(validate=True)
 
     assert isinstance(fdl.data, gpd.GeoDataFrame)
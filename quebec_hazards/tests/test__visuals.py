@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+from hazards.src.visuals.maps import (
+    _radii,
+    make_pydeck_map,
+    map_ordinal_to_plotly_color,
+)
+
+
+def test__map_ordinal_to_plotly_color():
+    palette = ["#000000", "#ff0000", "#00ff00"]
+    values = pd.Series([2001, 1999, None, 2005, 1999])
+
+    colors = map_ordinal_to_plotly_color(values, palette=palette, alpha=10)
+
+    assert colors.dtype == np.uint8
+    assert colors.tolist() == [
+        [255, 0, 0, 10],
+        [0, 0, 0, 10],
+        [150, 150, 150, 10],
+        [0, 255, 0, 10],
+        [0, 0, 0, 10],
+    ]
+
+
+def test__map_ordinal_to_plotly_color__loops_palette():
+    palette = ["#000000", "#ff0000"]
+
+    colors = map_ordinal_to_plotly_color([1, 2, 3], palette=palette, alpha=10)
+
+    assert colors.tolist() == [[0, 0, 0, 10], [255, 0, 0, 10], [0, 0, 0, 10]]
+
+
+def test__radii():
+    size_ha = np.array([0.0, 5.0, 1e5, np.nan, 300.0])
+
+    scaled = np.sqrt(np.clip(size_ha, 0.1, 10000))
+    scaled = (scaled - np.nanmin(scaled)) / (np.nanmax(scaled) - np.nanmin(scaled))
+    expected = scaled * (5000 - 300) + 300
+
+    radii = _radii(size_ha, 0.1, 10000.0, 300.0, 5000.0)
+
+    np.testing.assert_allclose(radii, expected)
+
+
+def test__make_pydeck_map__formats_sizes():
+    df = pd.DataFrame(
+        {
+            "longitude": [-70.1, -72.5, -71.0],
+            "latitude": [48.25, 47.7, 49.0],
+            "size_ha": [1220.5, None, 15.0],
+            "year": [2023, 2023, 2023],
+        },
+        index=[10, 20, 30],
+    )
+
+    deck = make_pydeck_map(df)
+
+    assert [row["size_ha_fmt"] for row in deck.layers[0].data] == ["1,220", "0", "15"]